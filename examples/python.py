@@ -10,6 +10,9 @@ authentication, and error handling.
 Requirements:
     pip install requests
 
+Optional:
+    pip install aiohttp "uvloop>=0.18" ijson orjson "httpx[http2]"
+
 Usage:
     python examples/python.py
 
@@ -17,31 +20,97 @@ Or import as a library:
     from examples.python import CycleTLSClient
 """
 
+from __future__ import annotations
+
 import json
 import time
-import uuid
+import secrets
 import asyncio
+import functools
+import importlib
+import importlib.util
+import threading
 import concurrent.futures
-from typing import Dict, Optional, Any, List, Union
-from dataclasses import dataclass, asdict
+from typing import TYPE_CHECKING, Dict, Optional, Any, Iterator, List, Tuple, Union
+from dataclasses import dataclass
 from enum import Enum
+from types import MappingProxyType
 
-try:
-    import requests
-    from requests.adapters import HTTPAdapter
-    from urllib3.util.retry import Retry
-except ImportError as e:
-    print("Error: requests library is required")
-    print("Install with: pip install requests")
-    raise e
-
-try:
+if TYPE_CHECKING:
     import aiohttp
-    AIOHTTP_AVAILABLE = True
-except ImportError:
-    AIOHTTP_AVAILABLE = False
-    print("Warning: aiohttp not available for async examples")
-    print("Install with: pip install aiohttp for async support")
+    import httpx
+    import ijson
+    import requests
+else:
+    # HTTP libraries are imported on first use by the client that needs them,
+    # so importing BrowserProfile or ProxyConfig stays cheap
+    aiohttp = httpx = ijson = orjson = requests = None
+
+
+def _require(name: str, error: str):
+    """Import an optional dependency on first use and bind it at module level."""
+    module = globals()[name]
+    if module is None:
+        try:
+            module = importlib.import_module(name)
+        except ImportError as e:
+            raise ImportError(error) from e
+        globals()[name] = module
+    return module
+
+
+@functools.lru_cache(maxsize=None)
+def _is_installed(name: str) -> bool:
+    """Check whether a dependency is available without importing it."""
+    return globals().get(name) is not None or importlib.util.find_spec(name) is not None
+
+
+@functools.lru_cache(maxsize=None)
+def _orjson():
+    """Return the orjson module if it is installed, else None (resolved once)."""
+    if not _is_installed("orjson"):
+        return None
+    return _require("orjson", "orjson is not installed")
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """
+    Encode a payload for the json_bytes argument, using orjson when installed.
+    
+    Note that orjson encodes NaN and Infinity as null, where the stdlib
+    fallback rejects them. Payloads orjson cannot encode, such as integers
+    beyond 64 bits, fall back to the stdlib.
+    """
+    fast = _orjson()
+    if fast is not None:
+        try:
+            return fast.dumps(obj, option=fast.OPT_NON_STR_KEYS)
+        except fast.JSONEncodeError:
+            pass
+    # Match requests, which refuses to send NaN/Infinity as JSON
+    return json.dumps(obj, allow_nan=False).encode()
+
+
+def response_json(response: requests.Response) -> Any:
+    """Decode a response body as JSON, using orjson when it is installed."""
+    fast = _orjson()
+    if fast is None:
+        return response.json()
+    try:
+        return fast.loads(response.content)
+    except fast.JSONDecodeError as e:
+        # Raise the same error type as response.json()
+        raise requests.exceptions.JSONDecodeError(e.msg, e.doc, e.pos)
+
+
+# Proxy configuration header names
+_HDR_URL = "X-URL"
+_HDR_ID = "X-IDENTIFIER"
+_HDR_SESSION = "X-SESSION-ID"
+_HDR_PROXY = "X-PROXY"
+_HDR_TIMEOUT = "X-TIMEOUT"
+
+_EMPTY_HEADERS = MappingProxyType({})
 
 
 class BrowserProfile(Enum):
@@ -59,7 +128,13 @@ class BrowserProfile(Enum):
 
 @dataclass
 class ProxyConfig:
-    """Configuration for CycleTLS-Proxy requests."""
+    """
+    Configuration for CycleTLS-Proxy requests.
+    
+    Informational only: no client accepts a ProxyConfig. Its fields match
+    the keyword arguments of request(), so a config can be applied with
+    ``client.get(**dataclasses.asdict(config))``.
+    """
     url: str
     profile: Union[str, BrowserProfile] = BrowserProfile.CHROME
     session_id: Optional[str] = None
@@ -72,6 +147,38 @@ class ProxyConfig:
             self.profile = self.profile.value
 
 
+class _ProxyHeadersMixin:
+    """Builds the X-* configuration headers sent to the proxy."""
+    
+    def _make_headers(self, url: str, profile: Union[str, BrowserProfile],
+                      session_id: Optional[str] = None,
+                      upstream_proxy: Optional[str] = None,
+                      timeout: Optional[int] = None,
+                      extra_headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        """Create headers for the proxy request."""
+        if isinstance(profile, BrowserProfile):
+            profile = profile.value
+        
+        headers = {}
+        headers[_HDR_URL] = url
+        headers[_HDR_ID] = profile
+        
+        if session_id:
+            headers[_HDR_SESSION] = session_id
+        
+        if upstream_proxy:
+            headers[_HDR_PROXY] = upstream_proxy
+        
+        # Always sent so the proxy and the client agree on the timeout, even
+        # when the client default differs from the proxy's own 30s default
+        if timeout is not None:
+            headers[_HDR_TIMEOUT] = str(timeout)
+        
+        headers.update(extra_headers or _EMPTY_HEADERS)
+        
+        return headers
+
+
 class CycleTLSError(Exception):
     """Base exception for CycleTLS-Proxy errors."""
     pass
@@ -87,7 +194,7 @@ class CycleTLSInvalidProfileError(CycleTLSError):
     pass
 
 
-class CycleTLSClient:
+class CycleTLSClient(_ProxyHeadersMixin):
     """
     Python client for CycleTLS-Proxy server.
     
@@ -114,40 +221,40 @@ class CycleTLSClient:
             default_timeout: Default timeout for requests in seconds
             max_retries: Maximum number of retry attempts
         """
+        _require("requests", "requests is required for CycleTLSClient (pip install requests)")
+        from urllib3.util.retry import Retry
+        
         self.proxy_url = proxy_url.rstrip('/')
         self.default_timeout = default_timeout
         
-        # Configure requests session with retries
-        self.session = requests.Session()
+        # Profiles reported by the server, fetched once on first use
+        self._profiles_cache: Optional[Tuple[str, ...]] = None
+        self._profiles_lock = threading.Lock()
+        
+        # Configure requests session with retries. It is not named `session`
+        # because that would shadow the session() method below
+        self.http_session = requests.Session()
+        # Timeouts are not retried so they fail fast. The proxy reports
+        # upstream failures, including its own timeouts, as 502, so that
+        # status is not retried either. The final response of an exhausted
+        # retry is returned to _handle_response instead of raising
         retry_strategy = Retry(
             total=max_retries,
+            read=0,
             backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
+            status_forcelist=[429, 500, 503, 504],
+            raise_on_status=False,
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
-    
-    def _make_headers(self, config: ProxyConfig, extra_headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
-        """Create headers for the proxy request."""
-        headers = {
-            "X-URL": config.url,
-            "X-IDENTIFIER": config.profile,
-        }
-        
-        if config.session_id:
-            headers["X-SESSION-ID"] = config.session_id
-        
-        if config.upstream_proxy:
-            headers["X-PROXY"] = config.upstream_proxy
-        
-        if config.timeout != self.default_timeout:
-            headers["X-TIMEOUT"] = str(config.timeout)
-        
-        if extra_headers:
-            headers.update(extra_headers)
-        
-        return headers
+        # Only one host (the proxy) is ever contacted, so size the pool for
+        # concurrent workers rather than for many distinct hosts
+        adapter = requests.adapters.HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=32,
+            pool_maxsize=64,
+            pool_block=False,
+        )
+        self.http_session.mount("http://", adapter)
+        self.http_session.mount("https://", adapter)
     
     def _handle_response(self, response: requests.Response) -> requests.Response:
         """Handle and validate proxy response."""
@@ -163,7 +270,11 @@ class CycleTLSClient:
                 else:
                     raise CycleTLSError(f"Bad request: {error_text}")
             elif response.status_code == 502:
-                raise CycleTLSError(f"Upstream request failed: {response.text}")
+                error_text = response.text
+                lowered = error_text.lower()
+                if "timeout" in lowered or "deadline exceeded" in lowered:
+                    raise CycleTLSTimeoutError(f"Request timeout: {error_text}")
+                raise CycleTLSError(f"Upstream request failed: {error_text}")
             else:
                 raise CycleTLSError(f"HTTP {response.status_code}: {response.text}")
         
@@ -175,6 +286,7 @@ class CycleTLSClient:
                 upstream_proxy: Optional[str] = None,
                 timeout: Optional[int] = None,
                 headers: Optional[Dict[str, str]] = None,
+                json_bytes: Optional[bytes] = None,
                 **kwargs) -> requests.Response:
         """
         Make a request through the CycleTLS-Proxy.
@@ -187,6 +299,8 @@ class CycleTLSClient:
             upstream_proxy: Optional upstream proxy URL
             timeout: Request timeout in seconds
             headers: Additional headers to send
+            json_bytes: Pre-serialized JSON body, sent as-is with an
+                application/json content type
             **kwargs: Additional arguments passed to requests
             
         Returns:
@@ -195,29 +309,38 @@ class CycleTLSClient:
         Raises:
             CycleTLSError: On various proxy-related errors
         """
-        config = ProxyConfig(
-            url=url,
-            profile=profile,
+        timeout = timeout or self.default_timeout
+        
+        if json_bytes is not None:
+            kwargs['data'] = json_bytes
+            headers = {**(headers or {}), "Content-Type": "application/json"}
+        
+        proxy_headers = self._make_headers(
+            url, profile,
             session_id=session_id,
             upstream_proxy=upstream_proxy,
-            timeout=timeout or self.default_timeout
+            timeout=timeout,
+            extra_headers=headers,
         )
         
-        proxy_headers = self._make_headers(config, headers)
-        
         try:
-            response = self.session.request(
+            response = self.http_session.request(
                 method=method,
                 url=self.proxy_url,
                 headers=proxy_headers,
-                timeout=config.timeout + 5,  # Add buffer for proxy overhead
+                timeout=timeout,  # Same limit as X-TIMEOUT; either side's timeout raises CycleTLSTimeoutError
                 **kwargs
             )
             return self._handle_response(response)
         
         except requests.exceptions.Timeout:
-            raise CycleTLSTimeoutError(f"Request timed out after {config.timeout}s")
+            raise CycleTLSTimeoutError(f"Request timed out after {timeout}s")
         except requests.exceptions.ConnectionError as e:
+            # An exhausted read retry arrives as ConnectionError(MaxRetryError)
+            from urllib3.exceptions import MaxRetryError, ReadTimeoutError
+            cause = e.args[0] if e.args else None
+            if isinstance(cause, MaxRetryError) and isinstance(cause.reason, ReadTimeoutError):
+                raise CycleTLSTimeoutError(f"Request timed out after {timeout}s")
             raise CycleTLSError(f"Connection error: {e}")
     
     def get(self, url: str, **kwargs) -> requests.Response:
@@ -244,6 +367,26 @@ class CycleTLSClient:
         """Make a HEAD request."""
         return self.request("HEAD", url, **kwargs)
     
+    def stream_json(self, method: str, url: str, prefix: str = "item",
+                    **kwargs) -> Iterator[Any]:
+        """
+        Iterate over items of a large JSON response without loading it whole.
+        
+        Args:
+            method: HTTP method (GET, POST, PUT, etc.)
+            url: Target URL to request
+            prefix: ijson prefix of the items to yield, e.g. "data.item"
+            **kwargs: Additional arguments passed to request()
+            
+        Yields:
+            Decoded JSON items matching the prefix
+        """
+        _require("ijson", "ijson is required for stream_json")
+        
+        with self.request(method, url, stream=True, **kwargs) as response:
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, prefix)
+    
     def session(self, session_id: Optional[str] = None) -> 'SessionContext':
         """
         Create a session context for persistent connections.
@@ -255,7 +398,7 @@ class CycleTLSClient:
             SessionContext object for use in 'with' statements
         """
         if session_id is None:
-            session_id = f"python-session-{uuid.uuid4().hex[:8]}"
+            session_id = f"python-session-{secrets.token_hex(4)}"
         
         return SessionContext(self, session_id)
     
@@ -267,9 +410,9 @@ class CycleTLSClient:
             Dictionary containing server health information
         """
         try:
-            response = self.session.get(f"{self.proxy_url}/health", timeout=5)
+            response = self.http_session.get(f"{self.proxy_url}/health", timeout=5)
             response.raise_for_status()
-            return response.json()
+            return response_json(response)
         except Exception as e:
             raise CycleTLSError(f"Health check failed: {e}")
     
@@ -277,18 +420,28 @@ class CycleTLSClient:
         """
         Get list of available browser profiles from server.
         
+        The server list is cached after the first successful lookup.
+        
         Returns:
             List of available profile identifiers
         """
-        health = self.health_check()
-        # Parse available profiles from error message by trying invalid profile
-        try:
-            self.get("https://httpbin.org/get", profile="invalid-profile-test")
-        except CycleTLSInvalidProfileError as e:
-            import re
-            match = re.search(r'Available profiles: ([^"]+)', str(e))
-            if match:
-                return [p.strip() for p in match.group(1).split(',')]
+        if self._profiles_cache is not None:
+            return list(self._profiles_cache)
+        
+        with self._profiles_lock:
+            if self._profiles_cache is not None:
+                return list(self._profiles_cache)
+            
+            health = self.health_check()
+            # Parse available profiles from error message by trying invalid profile
+            try:
+                self.get("https://httpbin.org/get", profile="invalid-profile-test")
+            except CycleTLSInvalidProfileError as e:
+                _, sep, tail = str(e).partition('Available profiles: ')
+                if sep:
+                    profiles = tail.split('"', 1)[0]
+                    self._profiles_cache = tuple(p.strip() for p in profiles.split(','))
+                    return list(self._profiles_cache)
         
         # Fallback to known profiles
         return [profile.value for profile in BrowserProfile]
@@ -334,54 +487,78 @@ class SessionContext:
         return self.request("DELETE", url, **kwargs)
 
 
-class AsyncCycleTLSClient:
+class _AsyncClientBase(_ProxyHeadersMixin):
+    """Request helpers shared by the async CycleTLS clients.
+    
+    Subclasses provide request() and the async context manager methods.
+    """
+    
+    def __init__(self, proxy_url: str = "http://localhost:8080",
+                 default_timeout: int = 30):
+        self.proxy_url = proxy_url.rstrip('/')
+        self.default_timeout = default_timeout
+        self.session = None
+    
+    async def get(self, url: str, **kwargs) -> Any:
+        """Make an async GET request."""
+        return await self.request("GET", url, **kwargs)
+    
+    async def post(self, url: str, **kwargs) -> Any:
+        """Make an async POST request."""
+        return await self.request("POST", url, **kwargs)
+    
+    async def pipeline(self, specs: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Issue independent requests concurrently.
+        
+        Args:
+            specs: Keyword arguments for request(), including method and url
+            
+        Returns:
+            Responses in spec order, with failures returned as exceptions.
+            aiohttp responses must be released by the caller.
+        """
+        return await asyncio.gather(
+            *(self.request(**spec) for spec in specs),
+            return_exceptions=True
+        )
+
+
+class AsyncCycleTLSClient(_AsyncClientBase):
     """
     Async version of CycleTLS client using aiohttp.
     
+    A single connection pool to the proxy is opened per context, so one
+    client instance should be kept for the lifetime of the application
+    rather than entered once per request.
+    
     Examples:
         >>> async with AsyncCycleTLSClient() as client:
-        ...     response = await client.get("https://httpbin.org/json")
-        ...     data = await response.json()
+        ...     async with await client.get("https://httpbin.org/json") as response:
+        ...         data = await response.json()
     """
     
     def __init__(self, proxy_url: str = "http://localhost:8080", 
                  default_timeout: int = 30):
-        if not AIOHTTP_AVAILABLE:
-            raise ImportError("aiohttp is required for AsyncCycleTLSClient")
-        
-        self.proxy_url = proxy_url.rstrip('/')
-        self.default_timeout = default_timeout
-        self.session = None
+        _require("aiohttp", "aiohttp is required for AsyncCycleTLSClient")
+        super().__init__(proxy_url, default_timeout)
     
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        # All requests go to the same proxy host, so lift the default
+        # per-host cap and keep pooled connections alive between requests
+        connector = aiohttp.TCPConnector(
+            limit=0,
+            limit_per_host=256,
+            ttl_dns_cache=300,
+            keepalive_timeout=75,
+        )
+        self.session = aiohttp.ClientSession(connector=connector)
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         if self.session:
             await self.session.close()
     
-    def _make_headers(self, config: ProxyConfig, extra_headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
-        """Create headers for the proxy request."""
-        headers = {
-            "X-URL": config.url,
-            "X-IDENTIFIER": config.profile,
-        }
-        
-        if config.session_id:
-            headers["X-SESSION-ID"] = config.session_id
-        
-        if config.upstream_proxy:
-            headers["X-PROXY"] = config.upstream_proxy
-        
-        if config.timeout != self.default_timeout:
-            headers["X-TIMEOUT"] = str(config.timeout)
-        
-        if extra_headers:
-            headers.update(extra_headers)
-        
-        return headers
-    
     async def request(self, method: str, url: str,
                      profile: Union[str, BrowserProfile] = BrowserProfile.CHROME,
                      session_id: Optional[str] = None,
@@ -393,39 +570,104 @@ class AsyncCycleTLSClient:
         if not self.session:
             raise RuntimeError("Client must be used in async context manager")
         
-        config = ProxyConfig(
-            url=url,
-            profile=profile,
+        timeout = timeout or self.default_timeout
+        
+        proxy_headers = self._make_headers(
+            url, profile,
             session_id=session_id,
             upstream_proxy=upstream_proxy,
-            timeout=timeout or self.default_timeout
+            timeout=timeout,
+            extra_headers=headers,
         )
         
-        proxy_headers = self._make_headers(config, headers)
-        
         try:
-            timeout_obj = aiohttp.ClientTimeout(total=config.timeout + 5)
-            async with self.session.request(
+            timeout_obj = aiohttp.ClientTimeout(total=timeout)
+            # The caller owns the response and must release it, e.g. with
+            # ``async with await client.get(...) as response``
+            return await self.session.request(
                 method=method,
                 url=self.proxy_url,
                 headers=proxy_headers,
                 timeout=timeout_obj,
                 **kwargs
-            ) as response:
-                return response
+            )
         
         except asyncio.TimeoutError:
-            raise CycleTLSTimeoutError(f"Request timed out after {config.timeout}s")
+            raise CycleTLSTimeoutError(f"Request timed out after {timeout}s")
         except aiohttp.ClientError as e:
             raise CycleTLSError(f"Request error: {e}")
+
+
+class HTTP2AsyncCycleTLSClient(_AsyncClientBase):
+    """
+    Async CycleTLS client using httpx with HTTP/2 multiplexing.
     
-    async def get(self, url: str, **kwargs) -> aiohttp.ClientResponse:
-        """Make an async GET request."""
-        return await self.request("GET", url, **kwargs)
+    When the proxy is served over TLS with HTTP/2 (for example behind the
+    bundled nginx config), all concurrent requests share a single
+    connection instead of opening one socket each. Plain ``http://`` proxy
+    URLs fall back to HTTP/1.1 with a normal connection pool.
     
-    async def post(self, url: str, **kwargs) -> aiohttp.ClientResponse:
-        """Make an async POST request."""
-        return await self.request("POST", url, **kwargs)
+    Examples:
+        >>> async with HTTP2AsyncCycleTLSClient("https://proxy.example.com") as client:
+        ...     response = await client.get("https://httpbin.org/json")
+        ...     data = response.json()
+    """
+    
+    def __init__(self, proxy_url: str = "http://localhost:8080",
+                 default_timeout: int = 30):
+        _require("httpx", "httpx[http2] is required for HTTP2AsyncCycleTLSClient")
+        if not _is_installed("h2"):
+            raise ImportError("httpx[http2] is required for HTTP2AsyncCycleTLSClient")
+        super().__init__(proxy_url, default_timeout)
+    
+    async def __aenter__(self):
+        if self.proxy_url.startswith("https://"):
+            # HTTP/2 is negotiated over TLS, so one multiplexed connection
+            # is enough for every in-flight request
+            limits = httpx.Limits(max_connections=1, max_keepalive_connections=1)
+        else:
+            limits = httpx.Limits()
+        self.session = httpx.AsyncClient(http2=True, limits=limits)
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self.session:
+            await self.session.aclose()
+    
+    async def request(self, method: str, url: str,
+                     profile: Union[str, BrowserProfile] = BrowserProfile.CHROME,
+                     session_id: Optional[str] = None,
+                     upstream_proxy: Optional[str] = None,
+                     timeout: Optional[int] = None,
+                     headers: Optional[Dict[str, str]] = None,
+                     **kwargs) -> httpx.Response:
+        """Make an async request through the CycleTLS-Proxy."""
+        if not self.session:
+            raise RuntimeError("Client must be used in async context manager")
+        
+        timeout = timeout or self.default_timeout
+        
+        proxy_headers = self._make_headers(
+            url, profile,
+            session_id=session_id,
+            upstream_proxy=upstream_proxy,
+            timeout=timeout,
+            extra_headers=headers,
+        )
+        
+        try:
+            return await self.session.request(
+                method=method,
+                url=self.proxy_url,
+                headers=proxy_headers,
+                timeout=timeout,
+                **kwargs
+            )
+        
+        except httpx.TimeoutException:
+            raise CycleTLSTimeoutError(f"Request timed out after {timeout}s")
+        except httpx.HTTPError as e:
+            raise CycleTLSError(f"Request error: {e}")
 
 
 def run_basic_examples():
@@ -459,7 +701,7 @@ def run_basic_examples():
     for profile, description in profiles_to_test:
         try:
             response = client.get("https://httpbin.org/user-agent", profile=profile)
-            user_agent = response.json()["user-agent"]
+            user_agent = response_json(response)["user-agent"]
             print(f"✓ {description}: {user_agent}")
         except Exception as e:
             print(f"✗ {description}: {e}")
@@ -480,7 +722,7 @@ def run_basic_examples():
             json=data,
             headers={"Content-Type": "application/json"}
         )
-        result = response.json()
+        result = response_json(response)
         print(f"✓ POST with JSON: {result['json']['username']}")
     except Exception as e:
         print(f"✗ POST request failed: {e}")
@@ -522,7 +764,7 @@ def run_session_examples():
             
             # Verify cookie persistence
             response = session.get("https://httpbin.org/cookies")
-            cookies = response.json().get("cookies", {})
+            cookies = response_json(response).get("cookies", {})
             if "session_token" in cookies:
                 print(f"✓ Session cookie persisted: {cookies['session_token']}")
             else:
@@ -533,7 +775,7 @@ def run_session_examples():
             
             # Check both cookies
             response = session.get("https://httpbin.org/cookies")
-            cookies = response.json().get("cookies", {})
+            cookies = response_json(response).get("cookies", {})
             print(f"✓ Session has {len(cookies)} cookies: {list(cookies.keys())}")
             
         except Exception as e:
@@ -555,7 +797,7 @@ def run_authentication_examples():
             headers={"Authorization": f"Basic {credentials}"},
             profile=BrowserProfile.CHROME
         )
-        result = response.json()
+        result = response_json(response)
         print(f"✓ Basic auth: {result['authenticated']}")
     except Exception as e:
         print(f"✗ Basic auth failed: {e}")
@@ -567,7 +809,7 @@ def run_authentication_examples():
             headers={"Authorization": "Bearer test-token-12345"},
             profile=BrowserProfile.FIREFOX
         )
-        result = response.json()
+        result = response_json(response)
         print(f"✓ Bearer token: {result['authenticated']}")
     except Exception as e:
         print(f"✗ Bearer token failed: {e}")
@@ -592,7 +834,7 @@ def run_advanced_examples():
             headers=headers,
             profile=BrowserProfile.SAFARI_IOS
         )
-        result_headers = response.json()["headers"]
+        result_headers = response_json(response)["headers"]
         print(f"✓ Custom headers forwarded: {len(result_headers)} headers")
         
         # Check if User-Agent was correctly overridden by profile
@@ -630,13 +872,25 @@ def run_advanced_examples():
                 "client": "python-example"
             }
         }
-        response = client.post(
-            "https://httpbin.org/post",
-            json=large_data,
-            profile=BrowserProfile.EDGE
-        )
-        result = response.json()
-        items_count = len(result["json"]["items"])
+        # Serialize once so the same body can be resent without re-encoding
+        payload = _json_dumps(large_data)
+        if _is_installed("ijson"):
+            # Count echoed items as they arrive instead of parsing the whole body
+            items_count = sum(1 for _ in client.stream_json(
+                "POST",
+                "https://httpbin.org/post",
+                prefix="json.items.item",
+                json_bytes=payload,
+                profile=BrowserProfile.EDGE
+            ))
+        else:
+            response = client.post(
+                "https://httpbin.org/post",
+                json_bytes=payload,
+                profile=BrowserProfile.EDGE
+            )
+            result = response_json(response)
+            items_count = len(result["json"]["items"])
         print(f"✓ Large JSON payload: {items_count} items sent")
     except Exception as e:
         print(f"✗ Large JSON payload failed: {e}")
@@ -681,10 +935,49 @@ def run_error_handling_examples():
         print(f"✗ Unexpected timeout error: {e}")
 
 
-def run_concurrent_examples():
-    """Run concurrent request examples."""
+async def run_concurrent_examples(num_requests: int = 10):
+    """Run concurrent request examples on a single event loop."""
     print("\n🔄 Concurrent Requests")
     
+    if not _is_installed("aiohttp"):
+        # Without aiohttp, fall back to a thread pool over the sync client
+        results, duration = _run_threaded_requests(num_requests)
+    else:
+        async with AsyncCycleTLSClient() as client:
+            async def make_request(request_id):
+                """Make a single request with unique session."""
+                async with await client.get(
+                    f"https://httpbin.org/get?request_id={request_id}",
+                    profile=BrowserProfile.CHROME,
+                    session_id=f"concurrent-{request_id}"
+                ) as response:
+                    body = await response.read()
+                    return request_id, response.status, len(body)
+            
+            start_time = time.time()
+            outcomes = await asyncio.gather(
+                *(make_request(i) for i in range(num_requests)),
+                return_exceptions=True
+            )
+            duration = time.time() - start_time
+        
+        results = [
+            (i, "ERROR", str(outcome)) if isinstance(outcome, BaseException) else outcome
+            for i, outcome in enumerate(outcomes)
+        ]
+    
+    successful = sum(1 for _, status, _ in results if isinstance(status, int) and status == 200)
+    
+    print(f"✓ Completed {successful}/{num_requests} concurrent requests in {duration:.2f}s")
+    for req_id, status, size in sorted(results):
+        if isinstance(status, int):
+            print(f"  Request {req_id}: HTTP {status}, {size} bytes")
+        else:
+            print(f"  Request {req_id}: {status}")
+
+
+def _run_threaded_requests(num_requests: int):
+    """Issue concurrent requests from a thread pool sharing one sync client."""
     client = CycleTLSClient()
     
     def make_request(request_id):
@@ -699,26 +992,25 @@ def run_concurrent_examples():
         except Exception as e:
             return request_id, "ERROR", str(e)
     
-    # Run 10 concurrent requests
+    # Open one pooled connection to the proxy before fanning out. Only the
+    # first worker to grab it skips connection setup; the others still
+    # connect concurrently, so this does not prevent a connection burst
+    try:
+        client.health_check()
+    except CycleTLSError:
+        pass
+    
     start_time = time.time()
-    with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
-        futures = [executor.submit(make_request, i) for i in range(10)]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=num_requests) as executor:
+        futures = [executor.submit(make_request, i) for i in range(num_requests)]
         results = [future.result() for future in concurrent.futures.as_completed(futures)]
     
-    duration = time.time() - start_time
-    successful = sum(1 for _, status, _ in results if isinstance(status, int) and status == 200)
-    
-    print(f"✓ Completed {successful}/10 concurrent requests in {duration:.2f}s")
-    for req_id, status, size in sorted(results):
-        if isinstance(status, int):
-            print(f"  Request {req_id}: HTTP {status}, {size} bytes")
-        else:
-            print(f"  Request {req_id}: {status}")
+    return results, time.time() - start_time
 
 
 async def run_async_examples():
     """Run async client examples."""
-    if not AIOHTTP_AVAILABLE:
+    if not _is_installed("aiohttp"):
         print("\n⚠️  Async examples require aiohttp (pip install aiohttp)")
         return
     
@@ -738,28 +1030,58 @@ async def run_async_examples():
         
         # Multiple async requests
         try:
-            tasks = []
-            for i in range(5):
-                task = client.get(
-                    f"https://httpbin.org/get?async_req={i}",
-                    profile=BrowserProfile.FIREFOX,
-                    session_id=f"async-session-{i}"
-                )
-                tasks.append(task)
+            # Cap in-flight requests so large batches don't queue up behind
+            # the proxy; the body is read before the slot is released
+            sem = asyncio.Semaphore(32)
+            
+            async def fetch(request_id):
+                """Make a single request and read its body within the limit."""
+                async with sem:
+                    async with await client.get(
+                        f"https://httpbin.org/get?async_req={request_id}",
+                        profile=BrowserProfile.FIREFOX,
+                        session_id=f"async-session-{request_id}"
+                    ) as response:
+                        return await response.json()
             
             start_time = time.time()
-            responses = await asyncio.gather(*tasks)
+            results = await asyncio.gather(
+                *(fetch(i) for i in range(5)),
+                return_exceptions=True
+            )
             duration = time.time() - start_time
             
             print(f"✓ Completed 5 async requests in {duration:.2f}s")
-            for i, response in enumerate(responses):
-                async with response as resp:
-                    data = await resp.json()
-                    args = data.get('args', {})
+            for i, result in enumerate(results):
+                if isinstance(result, BaseException):
+                    print(f"  Request {i}: {result}")
+                else:
+                    args = result.get('args', {})
                     print(f"  Request {i}: {args.get('async_req', 'N/A')}")
                     
         except Exception as e:
             print(f"✗ Multiple async requests failed: {e}")
+        
+        # Independent requests pipelined over the same client
+        try:
+            responses = await client.pipeline([
+                {
+                    "method": "GET",
+                    "url": f"https://httpbin.org/get?page={page}&limit=10",
+                    "profile": BrowserProfile.CHROME,
+                    "headers": {"X-API-Key": "demo-api-key-123"},
+                }
+                for page in (1, 2)
+            ])
+            
+            succeeded = 0
+            for response in responses:
+                if not isinstance(response, BaseException):
+                    response.release()
+                    succeeded += 1
+            print(f"✓ Pipelined {succeeded}/{len(responses)} resource list pages")
+        except Exception as e:
+            print(f"✗ Pipelined requests failed: {e}")
 
 
 def run_real_world_examples():
@@ -850,6 +1172,13 @@ def run_real_world_examples():
         print(f"✗ API interaction failed: {e}")
 
 
+def _run_async(coro):
+    """Run an async example on uvloop when it is installed, else asyncio."""
+    if _is_installed("uvloop"):
+        return importlib.import_module("uvloop").run(coro)
+    return asyncio.run(coro)
+
+
 def main():
     """Run all examples."""
     print("CycleTLS-Proxy Python Client - Comprehensive Examples")
@@ -872,10 +1201,10 @@ def main():
         run_error_handling_examples()
         
         # Concurrent requests
-        run_concurrent_examples()
+        _run_async(run_concurrent_examples())
         
         # Async examples
-        asyncio.run(run_async_examples())
+        _run_async(run_async_examples())
         
         # Real-world examples
         run_real_world_examples()